@@ -1,3 +1,6 @@
+import time
+from types import SimpleNamespace
+
 import pandas as pd
 from pandas._testing import assert_series_equal
 
@@ -27,3 +30,52 @@ def test_coerce_floats():
     series_expected = pd.Series([42.42], dtype="float64")
 
     assert_series_equal(series, series_expected)
+
+
+class _StationsValues(ScalarValuesCore):
+    """Values of fake stations, keeping track of the stations being collected"""
+
+    _data_tz = None
+    _date_parameters = ()
+    _irregular_parameters = ()
+    _integer_parameters = ()
+    _string_parameters = ()
+
+    def __init__(self, station_ids, max_workers=2):
+        super().__init__(
+            SimpleNamespace(station_id=pd.Series(station_ids), stations=SimpleNamespace(max_workers=max_workers))
+        )
+        self.collected = []
+
+    def _collect_station_parameter(self, station_id, parameter, dataset):
+        return pd.DataFrame()
+
+    def _collect_station_data(self, station_id):
+        self.collected.append(station_id)
+        # Finish stations in reverse order to check that results are yielded in order
+        time.sleep(0.01 * (10 - int(station_id)))
+        return pd.DataFrame({"station_id": [station_id]})
+
+
+def test_query_station_order():
+    values = _StationsValues([str(station_id) for station_id in range(10)])
+
+    station_ids = [result.df.at[0, "station_id"] for result in values.query()]
+
+    assert station_ids == [str(station_id) for station_id in range(10)]
+
+
+def test_query_close_early():
+    max_workers = 2
+    values = _StationsValues([str(station_id) for station_id in range(10)], max_workers=max_workers)
+
+    query = values.query()
+    next(query)
+    query.close()
+
+    # Only the first station and the ones collected ahead of it
+    assert len(values.collected) <= 1 + max_workers
+
+    time.sleep(0.2)
+
+    assert len(values.collected) <= 1 + max_workers
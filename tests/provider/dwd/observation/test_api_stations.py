@@ -3,6 +3,7 @@
 # Distributed under the MIT License. See LICENSE for more info.
 from datetime import datetime
 
+import mock
 import pandas as pd
 import pytest
 import pytz
@@ -135,3 +136,37 @@ def test_dwd_observations_stations_geojson():
         "type": "Point",
         "coordinates": [8.8493, 47.8413, 478.0],
     }
+
+
+@pytest.mark.parametrize("cache_disable,calls", [(False, 1), (True, 2)])
+def test_dwd_observations_stations_cached(monkeypatch, cache_disable, calls):
+    monkeypatch.setattr("wetterdienst.provider.dwd.observation.api.WD_CACHE_DISABLE", cache_disable)
+
+    DwdObservationRequest._create_station_index.cache_clear()
+
+    meta_index = pd.DataFrame({"station_id": ["00001", "00003"], "name": ["Aach", "Aachen"]})
+    file_index = pd.DataFrame({"station_id": ["00001"]})
+
+    with mock.patch(
+        "wetterdienst.provider.dwd.observation.api.create_meta_index_for_climate_observations",
+        return_value=meta_index,
+    ) as mock_meta_index, mock.patch(
+        "wetterdienst.provider.dwd.observation.api.create_file_index_for_climate_observations",
+        return_value=file_index,
+    ) as mock_file_index:
+        for _ in range(2):
+            df = DwdObservationRequest(
+                DwdObservationDataset.CLIMATE_SUMMARY,
+                DwdObservationResolution.DAILY,
+                DwdObservationPeriod.HISTORICAL,
+            )._all()
+
+            assert df["name"].tolist() == ["Aach"]
+
+            # Modifying the stations of one request must not change the cached stations
+            df.loc[:, "name"] = "FizzBuzz"
+
+    assert mock_meta_index.call_count == calls
+    assert mock_file_index.call_count == calls
+
+    DwdObservationRequest._create_station_index.cache_clear()
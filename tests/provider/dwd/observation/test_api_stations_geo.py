@@ -3,6 +3,7 @@
 # Distributed under the MIT License. See LICENSE for more info.
 from datetime import datetime
 
+import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -18,71 +19,72 @@ from wetterdienst.provider.dwd.observation import (
 )
 from wetterdienst.util.geo import Coordinates, derive_nearest_neighbours
 
-EXPECTED_STATIONS_DF = pd.DataFrame(
-    {
-        "station_id": pd.Series(["02480", "04411", "07341"], dtype=str),
-        "from_date": [
-            Timestamp("2004-09-01 00:00:00", tzinfo=pytz.UTC),
-            Timestamp("2002-01-24 00:00:00", tzinfo=pytz.UTC),
-            Timestamp("2005-07-16 00:00:00", tzinfo=pytz.UTC),
-        ],
-        "height": pd.Series(
-            [
-                108.0,
-                155.0,
-                119.0,
-            ],
-            dtype=float,
-        ),
-        "latitude": pd.Series(
-            [
-                50.0643,
-                49.9195,
-                50.0899,
-            ],
-            dtype=float,
-        ),
-        "longitude": pd.Series(
-            [
-                8.993,
-                8.9671,
-                8.7862,
-            ],
-            dtype=float,
-        ),
-        "name": pd.Series(
-            [
-                "Kahl/Main",
-                "Schaafheim-Schlierbach",
-                "Offenbach-Wetterpark",
-            ],
-            dtype=str,
-        ),
-        "state": pd.Series(
-            [
-                "Bayern",
-                "Hessen",
-                "Hessen",
-            ],
-            dtype=str,
-        ),
-        "distance": pd.Series(
-            [
-                9.759384982994229,
-                10.156943448624304,
-                12.882693521631097,
-            ],
-            dtype=float,
-        ),
-    }
-)
 
+@pytest.fixture(scope="module")
+def expected_df():
+    return pd.DataFrame(
+        {
+            "station_id": pd.Series(["02480", "04411", "07341"], dtype=str),
+            "from_date": [
+                Timestamp("2004-09-01 00:00:00", tzinfo=pytz.UTC),
+                Timestamp("2002-01-24 00:00:00", tzinfo=pytz.UTC),
+                Timestamp("2005-07-16 00:00:00", tzinfo=pytz.UTC),
+            ],
+            "height": pd.Series(
+                [
+                    108.0,
+                    155.0,
+                    119.0,
+                ],
+                dtype=float,
+            ),
+            "latitude": pd.Series(
+                [
+                    50.0643,
+                    49.9195,
+                    50.0899,
+                ],
+                dtype=float,
+            ),
+            "longitude": pd.Series(
+                [
+                    8.993,
+                    8.9671,
+                    8.7862,
+                ],
+                dtype=float,
+            ),
+            "name": pd.Series(
+                [
+                    "Kahl/Main",
+                    "Schaafheim-Schlierbach",
+                    "Offenbach-Wetterpark",
+                ],
+                dtype=str,
+            ),
+            "state": pd.Series(
+                [
+                    "Bayern",
+                    "Hessen",
+                    "Hessen",
+                ],
+                dtype=str,
+            ),
+            "distance": pd.Series(
+                [
+                    9.759384982994229,
+                    10.156943448624304,
+                    12.882693521631097,
+                ],
+                dtype=float,
+            ),
+        }
+    )
 
-@pytest.mark.remote
-def test_dwd_observation_stations_nearby_number_single():
 
-    # Test for one nearest station
-    request = DwdObservationRequest(
+@pytest.fixture(scope="module")
+def stations_request():
+    return DwdObservationRequest(
         DwdObservationDataset.TEMPERATURE_AIR,
         DwdObservationResolution.HOURLY,
         DwdObservationPeriod.RECENT,
@@ -90,128 +92,108 @@ def test_dwd_observation_stations_nearby_number_single():
         datetime(2020, 1, 20),
     )
 
-    nearby_station = request.filter_by_rank(
-        50.0,
-        8.9,
-        1,
-    )
-    nearby_station = nearby_station.df.drop("to_date", axis="columns")
-
-    assert_frame_equal(nearby_station, EXPECTED_STATIONS_DF.iloc[[0], :])
-
 
 @pytest.mark.remote
-def test_dwd_observation_stations_nearby_number_multiple():
-    request = DwdObservationRequest(
-        DwdObservationDataset.TEMPERATURE_AIR,
-        DwdObservationResolution.HOURLY,
-        DwdObservationPeriod.RECENT,
-        datetime(2020, 1, 1),
-        datetime(2020, 1, 20),
-    )
-    nearby_station = request.filter_by_rank(
-        50.0,
-        8.9,
-        3,
-    )
+@pytest.mark.parametrize(
+    "filter_,kwargs,rows,columns",
+    [
+        # Number, one nearest station
+        ("filter_by_rank", {"latitude": 50.0, "longitude": 8.9, "rank": 1}, [0], None),
+        # Number, multiple nearest stations
+        ("filter_by_rank", {"latitude": 50.0, "longitude": 8.9, "rank": 3}, [0, 1, 2], None),
+        # Distance in kilometers
+        ("filter_by_distance", {"latitude": 50.0, "longitude": 8.9, "distance": 16.13, "unit": "km"}, [0, 1, 2], None),
+        # Distance in miles
+        ("filter_by_distance", {"latitude": 50.0, "longitude": 8.9, "distance": 10.03, "unit": "mi"}, [0, 1, 2], None),
+        # Distance with spelled out unit
+        (
+            "filter_by_distance",
+            {"latitude": 50.0, "longitude": 8.9, "distance": 10.03, "unit": "Miles"},
+            [0, 1, 2],
+            None,
+        ),
+        # Bbox
+        (
+            "filter_by_bbox",
+            {"left": 8.7862, "bottom": 49.9195, "right": 8.993, "top": 50.0899},
+            [0, 1, 2],
+            ["distance"],
+        ),
+    ],
+    ids=["rank_single", "rank_multiple", "distance_km", "distance_mi", "distance_miles", "bbox"],
+)
+def test_dwd_observation_stations_geo(stations_request, expected_df, filter_, kwargs, rows, columns):
+    nearby_station = getattr(stations_request, filter_)(**kwargs)
     nearby_station = nearby_station.df.drop("to_date", axis="columns")
 
-    assert_frame_equal(nearby_station, EXPECTED_STATIONS_DF)
+    expected = expected_df.iloc[rows, :]
+    if columns:
+        expected = expected.drop(columns=columns)
 
+    assert_frame_equal(nearby_station, expected)
 
-@pytest.mark.remote
-def test_dwd_observation_stations_nearby_distance():
-    request = DwdObservationRequest(
-        DwdObservationDataset.TEMPERATURE_AIR,
-        DwdObservationResolution.HOURLY,
-        DwdObservationPeriod.RECENT,
-        datetime(2020, 1, 1),
-        datetime(2020, 1, 20),
-    )
-    # Kilometers
-    nearby_station = request.filter_by_distance(50.0, 8.9, 16.13, "km")
-    nearby_station = nearby_station.df.drop("to_date", axis="columns")
 
-    assert_frame_equal(nearby_station, EXPECTED_STATIONS_DF)
+@pytest.mark.remote
+def test_dwd_observation_stations_empty(stations_request):
+    # Bbox
+    assert stations_request.filter_by_bbox(
+        left=-100,
+        bottom=-20,
+        right=-90,
+        top=-10,
+    ).df.empty
 
-    # Miles
-    nearby_station = request.filter_by_distance(50.0, 8.9, 10.03, "mi")
-    nearby_station = nearby_station.df.drop(columns="to_date")
 
-    assert_frame_equal(nearby_station, EXPECTED_STATIONS_DF)
+@pytest.mark.remote
+@pytest.mark.parametrize(
+    "filter_,kwargs",
+    [
+        # Number
+        ("filter_by_rank", {"latitude": 51.4, "longitude": 9.3, "rank": 0}),
+        # Distance
+        ("filter_by_distance", {"latitude": 51.4, "longitude": 9.3, "distance": -1}),
+        # Distance unit
+        ("filter_by_distance", {"latitude": 51.4, "longitude": 9.3, "distance": 10, "unit": "parsec"}),
+        # Bbox
+        ("filter_by_bbox", {"left": 10, "bottom": 10, "right": 5, "top": 5}),
+    ],
+    ids=["rank", "distance", "distance_unit", "bbox"],
+)
+def test_dwd_observation_stations_fail(stations_request, filter_, kwargs):
+    with pytest.raises(ValueError):
+        getattr(stations_request, filter_)(**kwargs)
 
 
-@pytest.mark.remote
-def test_dwd_observation_stations_bbox():
+def test_dwd_observation_stations_geo_all_once():
     request = DwdObservationRequest(
         DwdObservationDataset.TEMPERATURE_AIR,
         DwdObservationResolution.HOURLY,
         DwdObservationPeriod.RECENT,
-        datetime(2020, 1, 1),
-        datetime(2020, 1, 20),
     )
-    nearby_station = request.filter_by_bbox(left=8.7862, bottom=49.9195, right=8.993, top=50.0899)
-    nearby_station = nearby_station.df.drop("to_date", axis="columns")
-
-    assert_frame_equal(nearby_station, EXPECTED_STATIONS_DF.drop(columns=["distance"]))
 
-
-@pytest.mark.remote
-def test_dwd_observation_stations_empty():
-    request = DwdObservationRequest(
-        DwdObservationDataset.TEMPERATURE_AIR,
-        DwdObservationResolution.HOURLY,
-        DwdObservationPeriod.RECENT,
-        datetime(2020, 1, 1),
-        datetime(2020, 1, 20),
+    stations = pd.DataFrame(
+        {
+            "station_id": ["02480", "04411", "07341"],
+            "from_date": ["2004-09-01", "2002-01-24", "2005-07-16"],
+            "to_date": ["2022-03-01", "2022-03-01", "2022-03-01"],
+            "height": [108.0, 155.0, 119.0],
+            "latitude": [50.0643, 49.9195, 50.0899],
+            "longitude": [8.993, 8.9671, 8.7862],
+            "name": ["Kahl/Main", "Schaafheim-Schlierbach", "Offenbach-Wetterpark"],
+            "state": ["Bayern", "Hessen", "Hessen"],
+        }
     )
 
-    # Bbox
-    assert request.filter_by_bbox(
-        left=-100,
-        bottom=-20,
-        right=-90,
-        top=-10,
-    ).df.empty
+    with mock.patch.object(DwdObservationRequest, "_all", return_value=stations) as mock_all:
+        rank = request.filter_by_rank(latitude=50.0, longitude=8.9, rank=1).df
+        distance = request.filter_by_distance(latitude=50.0, longitude=8.9, distance=12).df
+        bbox = request.filter_by_bbox(left=8.9, bottom=49.9, right=9.0, top=50.1).df
 
+    mock_all.assert_called_once()
 
-@pytest.mark.remote
-def test_dwd_observation_stations_fail():
-    # Number
-    with pytest.raises(ValueError):
-        DwdObservationRequest(
-            DwdObservationDataset.TEMPERATURE_AIR,
-            DwdObservationResolution.HOURLY,
-            DwdObservationPeriod.RECENT,
-            datetime(2020, 1, 1),
-            datetime(2020, 1, 20),
-        ).filter_by_rank(
-            51.4,
-            9.3,
-            0,
-        )
-    # Distance
-    with pytest.raises(ValueError):
-        DwdObservationRequest(
-            DwdObservationDataset.TEMPERATURE_AIR,
-            DwdObservationResolution.HOURLY,
-            DwdObservationPeriod.RECENT,
-            datetime(2020, 1, 1),
-            datetime(2020, 1, 20),
-        ).filter_by_distance(
-            51.4,
-            9.3,
-            -1,
-        )
-    # Bbox
-    with pytest.raises(ValueError):
-        DwdObservationRequest(
-            DwdObservationDataset.TEMPERATURE_AIR,
-            DwdObservationResolution.HOURLY,
-            DwdObservationPeriod.RECENT,
-            datetime(2020, 1, 1),
-            datetime(2020, 1, 20),
-        ).filter_by_bbox(left=10, bottom=10, right=5, top=5)
+    assert rank["station_id"].tolist() == ["02480"]
+    assert distance["station_id"].tolist() == ["02480", "04411"]
+    assert bbox["station_id"].tolist() == ["02480", "04411"]
 
 
 def test_derive_nearest_neighbours():
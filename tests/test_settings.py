@@ -15,6 +15,7 @@ def test_settings():
     assert Settings.tidy
     assert Settings.humanize
     assert Settings.si_units
+    assert Settings.max_workers == 4
 
     Settings.tidy = False
     assert not Settings.tidy
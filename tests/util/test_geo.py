@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
+import sys
+
 import numpy as np
+import pytest
+from scipy.spatial import cKDTree
 
-from wetterdienst.util.geo import Coordinates, convert_dm_to_dd
+from wetterdienst.util.geo import (
+    Coordinates,
+    convert_dm_to_dd,
+    derive_distance_tree,
+    derive_nearest_neighbours,
+    haversine_vector,
+    query_nearest_neighbours,
+    query_neighbours_within,
+)
 
 
 def test_get_coordinates():
@@ -31,3 +43,59 @@ def test_dms_to_dd():
     # test Mosmix station Muenster/Osnabrueck
     assert convert_dm_to_dd(7.42) == 7.7
     assert convert_dm_to_dd(52.08) == 52.13
+
+
+def test_haversine_vector():
+    """Test distances from one point to many points"""
+    distances = haversine_vector(
+        np.radians(50.0),
+        np.radians(8.9),
+        np.radians(np.array([50.0643, 49.9195, 50.0899])),
+        np.radians(np.array([8.993, 8.9671, 8.7862])),
+    )
+    np.testing.assert_array_almost_equal(distances, np.array([9.759385, 10.156943, 12.882694]))
+
+
+def test_query_distance_tree():
+    """Test nearest neighbours and neighbours within distance from a reused tree"""
+    tree = derive_distance_tree(
+        np.radians(np.array([52.1042, 52.8568, 49.9195, 55.0, 48.2639, 51.2835])),
+        np.radians(np.array([8.7521, 11.1319, 8.9671, 6.3333, 8.8134, 9.359])),
+    )
+
+    np.testing.assert_array_equal(
+        query_nearest_neighbours(tree, np.radians(50.0), np.radians(8.9), 3), np.array([2, 5, 4])
+    )
+    np.testing.assert_array_equal(query_nearest_neighbours(tree, np.radians(50.0), np.radians(8.9), 1), np.array([2]))
+
+    np.testing.assert_array_equal(
+        np.sort(query_neighbours_within(tree, np.radians(50.0), np.radians(8.9), 150)), np.array([2, 5])
+    )
+
+
+def test_derive_distance_tree_pykdtree(monkeypatch):
+    """Test nearest neighbours from pykdtree against the scipy fallback"""
+    pytest.importorskip("pykdtree")
+
+    latitudes = np.array([52.1042, 52.8568, 49.9195, 55.0, 48.2639, 51.2835])
+    longitudes = np.array([8.7521, 11.1319, 8.9671, 6.3333, 8.8134, 9.359])
+    coordinates = Coordinates(np.array([50.0, 53.5]), np.array([8.9, 10.0]))
+
+    tree = derive_distance_tree(np.radians(latitudes), np.radians(longitudes), ball_query=False)
+    distances, indices = derive_nearest_neighbours(latitudes, longitudes, coordinates, 3)
+
+    assert type(tree).__module__.startswith("pykdtree")
+
+    monkeypatch.setitem(sys.modules, "pykdtree.kdtree", None)
+
+    fallback_tree = derive_distance_tree(np.radians(latitudes), np.radians(longitudes), ball_query=False)
+    fallback_distances, fallback_indices = derive_nearest_neighbours(latitudes, longitudes, coordinates, 3)
+
+    assert isinstance(fallback_tree, cKDTree)
+
+    np.testing.assert_array_equal(
+        query_nearest_neighbours(tree, np.radians(50.0), np.radians(8.9), 3),
+        query_nearest_neighbours(fallback_tree, np.radians(50.0), np.radians(8.9), 3),
+    )
+    np.testing.assert_array_equal(indices, fallback_indices)
+    np.testing.assert_allclose(distances, fallback_distances)
@@ -2,18 +2,17 @@
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
 import logging
+import math
 from abc import abstractmethod
 from copy import copy
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import dateutil.parser
 import numpy as np
 import pandas as pd
 import pytz
-from measurement.measures import Distance
-from measurement.utils import guess
 from rapidfuzz import fuzz, process
 
 from wetterdienst.core.core import Core
@@ -27,11 +26,44 @@ from wetterdienst.metadata.provider import Provider
 from wetterdienst.metadata.resolution import Frequency, Resolution, ResolutionType
 from wetterdienst.settings import Settings
 from wetterdienst.util.enumeration import parse_enumeration_from_template
-from wetterdienst.util.geo import Coordinates, derive_nearest_neighbours
+from wetterdienst.util.geo import (
+    derive_distance_tree,
+    haversine_vector,
+    query_nearest_neighbours,
+    query_neighbours_within,
+)
 
 log = logging.getLogger(__name__)
 
-EARTH_RADIUS_KM = 6371
+# Factors to convert distances given in any of the supported units to km
+DISTANCE_UNIT_TO_KM = {
+    "km": 1.0,
+    "m": 0.001,
+    "mi": 1.609344,
+    "ft": 0.0003048,
+    "yd": 0.0009144,
+    "nmi": 1.852,
+}
+
+# Spelled out names of the supported distance units
+DISTANCE_UNIT_ALIASES = {
+    "kilometer": "km",
+    "kilometers": "km",
+    "kilometre": "km",
+    "kilometres": "km",
+    "meter": "m",
+    "meters": "m",
+    "metre": "m",
+    "metres": "m",
+    "mile": "mi",
+    "miles": "mi",
+    "foot": "ft",
+    "feet": "ft",
+    "yard": "yd",
+    "yards": "yd",
+    "nautical mile": "nmi",
+    "nautical miles": "nmi",
+}
 
 
 class ScalarRequestCore(Core):
@@ -353,6 +385,11 @@ class ScalarRequestCore(Core):
 
         self.si_units = copy(Settings.si_units)
 
+        self.max_workers = copy(Settings.max_workers)
+
+        # Stations with coordinates in radians and their k-d trees, reused by geo filters
+        self._stations_geo_index = None
+
         log.info(
             f"Processing request for "
             f"provider={self.provider}, "
@@ -363,7 +400,8 @@ class ScalarRequestCore(Core):
             f"end_date={self.end_date}, "
             f"humanize={self.humanize}, "
             f"tidy={self.tidy}, "
-            f"si_units={self.si_units}"
+            f"si_units={self.si_units}, "
+            f"max_workers={self.max_workers}"
         )
 
     @staticmethod
@@ -530,10 +568,15 @@ class ScalarRequestCore(Core):
         :param df: DataFrame with columns as strings
         :return: DataFrame with columns coerced to date etc.
         """
+        df = df.astype(
+            {
+                Columns.HEIGHT.value: float,
+                Columns.LATITUDE.value: float,
+                Columns.LONGITUDE.value: float,
+            }
+        )
+
         df[Columns.STATION_ID.value] = pd.Series(df[Columns.STATION_ID.value].values, dtype=str)
-        df[Columns.HEIGHT.value] = pd.Series(df[Columns.HEIGHT.value], dtype=float)
-        df[Columns.LATITUDE.value] = df[Columns.LATITUDE.value].astype(float)
-        df[Columns.LONGITUDE.value] = df[Columns.LONGITUDE.value].astype(float)
         df[Columns.NAME.value] = pd.Series(df[Columns.NAME.value].values, dtype=str)
         df[Columns.STATE.value] = pd.Series(df[Columns.STATE.value].values, dtype=str)
 
@@ -570,6 +613,53 @@ class ScalarRequestCore(Core):
 
         return StationsResult(self, df.copy().reset_index(drop=True))
 
+    def _get_stations_coordinates(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Method to get all stations together with their coordinates in radians. Both are
+        built once per request and reused by the geo filters. The returned DataFrame is
+        shared between calls and must not be modified.
+
+        :return: tuple of stations DataFrame and coordinates in radians with latitudes
+            in the first and longitudes in the second column
+        """
+        if self._stations_geo_index is None:
+            df = self.all().df
+
+            # Convert both columns in one pass, the array keeps the column-wise memory
+            # layout of the DataFrame so each column stays contiguous
+            coordinates = np.deg2rad(df[[Columns.LATITUDE.value, Columns.LONGITUDE.value]].to_numpy(dtype=float))
+
+            self._stations_geo_index = (df, coordinates, {})
+
+        df, coordinates, _ = self._stations_geo_index
+
+        return df, coordinates
+
+    def _get_stations_geo_index(self, ball_query: bool = True) -> Tuple[pd.DataFrame, np.ndarray, Optional[Any]]:
+        """
+        Method to get all stations together with their coordinates in radians and a k-d
+        tree of their locations. The tree is built once per request and kind of query
+        and reused by the geo filters.
+
+        :param ball_query: whether the k-d tree has to support ball queries, trees
+            for nearest neighbour queries only may be built with pykdtree
+        :return: tuple of stations DataFrame, coordinates in radians with latitudes in
+            the first and longitudes in the second column and k-d tree, which is None if
+            there are no stations
+        """
+        self._get_stations_coordinates()
+
+        df, coordinates, trees = self._stations_geo_index
+
+        if ball_query not in trees:
+            trees[ball_query] = (
+                derive_distance_tree(coordinates[:, 0], coordinates[:, 1], ball_query=ball_query)
+                if not df.empty
+                else None
+            )
+
+        return df, coordinates, trees[ball_query]
+
     def filter_by_station_id(self, station_id: Tuple[str, ...]) -> StationsResult:
         """
         Method to filter stations by station ids
@@ -618,7 +708,7 @@ class ScalarRequestCore(Core):
         if station_match:
             if first:
                 station_match = [station_match]
-            station_name = pd.Series(station_match).apply(lambda x: x[0])
+            station_name = [match[0] for match in station_match]
 
             df = df[df[Columns.NAME.value].isin(station_name)]
 
@@ -648,20 +738,24 @@ class ScalarRequestCore(Core):
         if rank <= 0:
             raise ValueError("'num_stations_nearby' has to be at least 1.")
 
-        coords = Coordinates(np.array(latitude), np.array(longitude))
+        df, coordinates, tree = self._get_stations_geo_index(ball_query=False)
 
-        df = self.all().df.reset_index(drop=True)
+        latitude_rad, longitude_rad = math.radians(latitude), math.radians(longitude)
 
-        distances, indices_nearest_neighbours = derive_nearest_neighbours(
-            df[Columns.LATITUDE.value].values,
-            df[Columns.LONGITUDE.value].values,
-            coords,
-            min(rank, df.shape[0]),
-        )
+        if tree is not None:
+            indices_nearest_neighbours = query_nearest_neighbours(
+                tree, latitude_rad, longitude_rad, min(rank, df.shape[0])
+            )
+        else:
+            indices_nearest_neighbours = np.array([], dtype=int)
 
-        df = df.iloc[indices_nearest_neighbours.flatten(), :].reset_index(drop=True)
+        nearest_coordinates = coordinates[indices_nearest_neighbours, :]
 
-        df[Columns.DISTANCE.value] = pd.Series(distances.flatten() * EARTH_RADIUS_KM, dtype=float)
+        distances = haversine_vector(latitude_rad, longitude_rad, nearest_coordinates[:, 0], nearest_coordinates[:, 1])
+
+        df = df.iloc[indices_nearest_neighbours, :].reset_index(drop=True)
+
+        df[Columns.DISTANCE.value] = pd.Series(distances, dtype=float)
 
         if df.empty:
             log.warning(
@@ -680,7 +774,7 @@ class ScalarRequestCore(Core):
         :param latitude: latitude in degrees
         :param longitude: longitude in degrees
         :param distance: distance (km) for which stations will be selected
-        :param unit: unit string for conversion
+        :param unit: unit of distance, one of km, m, mi, ft, yd, nmi or their names
         :return: pandas.DataFrame with station information for the selected stations
         """
         distance = float(distance)
@@ -689,14 +783,37 @@ class ScalarRequestCore(Core):
         if distance < 0:
             raise ValueError("'distance' has to be at least 0.0")
 
-        unit = unit.strip()
+        unit = unit.strip().lower()
+        unit = DISTANCE_UNIT_ALIASES.get(unit, unit)
 
-        distance_in_km = guess(distance, unit, [Distance]).km
+        try:
+            distance_in_km = distance * DISTANCE_UNIT_TO_KM[unit]
+        except KeyError as e:
+            raise ValueError(f"'unit' has to be one of {', '.join(DISTANCE_UNIT_TO_KM)}") from e
 
-        # TODO: replace the repeating call to self.all()
-        all_nearby_stations = self.filter_by_rank(latitude, longitude, self.all().df.shape[0]).df
+        df, coordinates, tree = self._get_stations_geo_index()
 
-        df = all_nearby_stations[all_nearby_stations[Columns.DISTANCE.value] <= distance_in_km]
+        latitude_rad, longitude_rad = math.radians(latitude), math.radians(longitude)
+
+        if tree is not None:
+            indices_nearby = np.sort(query_neighbours_within(tree, latitude_rad, longitude_rad, distance_in_km))
+        else:
+            indices_nearby = np.array([], dtype=int)
+
+        nearby_coordinates = coordinates[indices_nearby, :]
+
+        distances = haversine_vector(latitude_rad, longitude_rad, nearby_coordinates[:, 0], nearby_coordinates[:, 1])
+
+        # Exact check on the candidates found by the tree, ordered by distance
+        nearby = distances <= distance_in_km
+        order = np.argsort(distances[nearby], kind="stable")
+
+        indices_nearby = indices_nearby[nearby][order]
+        distances = distances[nearby][order]
+
+        df = df.iloc[indices_nearby, :].reset_index(drop=True)
+
+        df[Columns.DISTANCE.value] = pd.Series(distances, dtype=float)
 
         if df.empty:
             log.warning(
@@ -724,15 +841,11 @@ class ScalarRequestCore(Core):
         if bottom >= top:
             raise ValueError("bbox bottom border should be smaller then top")
 
-        lat_interval = pd.Interval(bottom, top, closed="both")
-        lon_interval = pd.Interval(left, right, closed="both")
+        df, _ = self._get_stations_coordinates()
 
-        df = self.all().df
+        mask = df[Columns.LATITUDE.value].between(bottom, top) & df[Columns.LONGITUDE.value].between(left, right)
 
-        df = df[
-            df[Columns.LATITUDE.value].apply(lambda x: x in lat_interval)
-            & df[Columns.LONGITUDE.value].apply(lambda x: x in lon_interval)
-        ]
+        df = df[mask]
 
         return StationsResult(stations=self, df=df.reset_index(drop=True))
 
@@ -5,8 +5,11 @@ import datetime
 import logging
 import operator
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from enum import Enum
+from itertools import islice
 from typing import Dict, Generator, List, Optional, Tuple, Union
 
 import numpy as np
@@ -443,103 +446,139 @@ class ScalarValuesCore(metaclass=ABCMeta):
         DataFrame for each station with all found parameters. Takes care of type
         coercion of data, date filtering and humanizing of parameters.
 
+        Data of multiple stations is collected concurrently as it is mostly bound by
+        network i/o, results are still yielded in order of the station ids. At most
+        max_workers stations (Settings.max_workers) are collected ahead of the
+        consumer, remaining stations are not collected anymore once the generator is
+        closed.
+
         :return:
         """
+        station_ids = iter(self.stations.station_id)
+        max_workers = self.stations.stations.max_workers
 
-        for station_id in self.stations.station_id:
-            # TODO: add method to return empty result with correct response string e.g.
-            #  station id not available
-            station_data = []
-
-            for parameter, dataset in self.stations.parameter:
-                # TODO: For now skip date based parameters as we didn't
-                #  yet decide how to convert those values to floats to
-                #  make them conform with tidy shape
-                single_tidy_date_parameters = self.stations.stations.tidy and parameter.value in self._date_parameters
-                if single_tidy_date_parameters:
-                    log.warning(
-                        f"parameter {parameter.value} is skipped in tidy format "
-                        f"as the date parameter is currently not converted to float"
-                    )
-                    continue
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = deque()
 
-                parameter_df = self._collect_station_parameter(station_id, parameter, dataset)
+        try:
+            for station_id in islice(station_ids, max_workers):
+                futures.append(executor.submit(self._collect_station_data, station_id))
 
-                if parameter_df.empty:
-                    station_data.append(self._create_empty_station_parameter_df(station_id, parameter, dataset))
+            while futures:
+                station_df = futures.popleft().result()
+
+                for station_id in islice(station_ids, 1):
+                    futures.append(executor.submit(self._collect_station_data, station_id))
+
+                # Empty dataframe should be skipped
+                if station_df.empty:
                     continue
 
-                self._coerce_date_fields(parameter_df, station_id)
+                # TODO: add more meaningful metadata here
+                yield ValuesResult(stations=self.stations, df=station_df)
+        finally:
+            # Only stations already being collected are waited for
+            for future in futures:
+                future.cancel()
 
-                # TODO: we are coercing values here for conversion of units
-                #  however we later again coerce when concatenating DataFrames
-                parameter_df = self._coerce_parameter_types(parameter_df)
+            executor.shutdown(wait=True)
 
-                if self.stations.stations.si_units:
-                    parameter_df = self.convert_values_to_si(parameter_df, dataset)
+    def _collect_station_data(self, station_id: str) -> pd.DataFrame:
+        """
+        Method to collect, coerce and filter the data of all requested parameters for
+        one station.
 
-                if self.stations.stations.tidy:
-                    if not self.stations.stations._has_tidy_data:
-                        parameter_df = self.tidy_up_df(parameter_df, dataset)
+        :param station_id: station id for which the data is being collected
+        :return: pandas.DataFrame with all found parameters of the station
+        """
+        # TODO: add method to return empty result with correct response string e.g.
+        #  station id not available
+        station_data = []
+
+        for parameter, dataset in self.stations.parameter:
+            # TODO: For now skip date based parameters as we didn't
+            #  yet decide how to convert those values to floats to
+            #  make them conform with tidy shape
+            single_tidy_date_parameters = self.stations.stations.tidy and parameter.value in self._date_parameters
+            if single_tidy_date_parameters:
+                log.warning(
+                    f"parameter {parameter.value} is skipped in tidy format "
+                    f"as the date parameter is currently not converted to float"
+                )
+                continue
 
-                    if parameter != dataset:
-                        parameter_df = parameter_df[parameter_df[Columns.PARAMETER.value] == parameter.value.lower()]
-                elif self.stations.stations._has_tidy_data:
-                    parameter_df = self.tabulate_df(parameter_df)
+            parameter_df = self._collect_station_parameter(station_id, parameter, dataset)
 
-                # Skip date fields in tidy format, no further check required as still
-                # "normal" parameters should be available
-                if self.stations.stations.tidy and self._date_parameters:
-                    parameter_df = parameter_df[~parameter_df[Columns.PARAMETER.value].isin(self._date_parameters)]
-                    log.warning(
-                        f"parameters {self._date_parameters} are skipped in tidy format "
-                        f"as the date parameters are currently not converted to floats"
-                    )
-                    if parameter_df.empty:
-                        continue
+            if parameter_df.empty:
+                station_data.append(self._create_empty_station_parameter_df(station_id, parameter, dataset))
+                continue
 
-                # Merge on full date range if values are found to ensure result
-                # even if no actual values exist
-                # For cases where requests are not defined by start and end date but rather by
-                # periods, use the returned df without modifications
-                # We may put a standard date range here if no data is found
-                if self.stations.stations.start_date:
-                    parameter_df = self._build_complete_df(parameter_df, station_id, parameter, dataset)
+            self._coerce_date_fields(parameter_df, station_id)
 
-                parameter_df[Columns.DATASET.value] = dataset.name.lower()
+            # TODO: we are coercing values here for conversion of units
+            #  however we later again coerce when concatenating DataFrames
+            parameter_df = self._coerce_parameter_types(parameter_df)
 
-                station_data.append(parameter_df)
+            if self.stations.stations.si_units:
+                parameter_df = self.convert_values_to_si(parameter_df, dataset)
 
-            try:
-                station_df = pd.concat(station_data, ignore_index=True)
-            except ValueError:
-                station_df = pd.DataFrame()
+            if self.stations.stations.tidy:
+                if not self.stations.stations._has_tidy_data:
+                    parameter_df = self.tidy_up_df(parameter_df, dataset)
 
-            station_df = self._organize_df_columns(station_df)
+                if parameter != dataset:
+                    parameter_df = parameter_df[parameter_df[Columns.PARAMETER.value] == parameter.value.lower()]
+            elif self.stations.stations._has_tidy_data:
+                parameter_df = self.tabulate_df(parameter_df)
 
-            station_df[Columns.STATION_ID.value] = station_id
+            # Skip date fields in tidy format, no further check required as still
+            # "normal" parameters should be available
+            if self.stations.stations.tidy and self._date_parameters:
+                parameter_df = parameter_df[~parameter_df[Columns.PARAMETER.value].isin(self._date_parameters)]
+                log.warning(
+                    f"parameters {self._date_parameters} are skipped in tidy format "
+                    f"as the date parameters are currently not converted to floats"
+                )
+                if parameter_df.empty:
+                    continue
 
-            station_df = self._coerce_meta_fields(station_df)
+            # Merge on full date range if values are found to ensure result
+            # even if no actual values exist
+            # For cases where requests are not defined by start and end date but rather by
+            # periods, use the returned df without modifications
+            # We may put a standard date range here if no data is found
+            if self.stations.stations.start_date:
+                parameter_df = self._build_complete_df(parameter_df, station_id, parameter, dataset)
 
-            # Filter for dates range if start_date and end_date are defined
-            if not station_df.empty and self.stations.start_date:
-                station_df = station_df[
-                    (station_df[Columns.DATE.value] >= self.stations.start_date)
-                    & (station_df[Columns.DATE.value] <= self.stations.end_date)
-                ]
+            parameter_df[Columns.DATASET.value] = dataset.name.lower()
 
-            station_df = self._coerce_parameter_types(station_df)
+            station_data.append(parameter_df)
 
-            # Assign meaningful parameter names (humanized).
-            if self.stations.humanize:
-                station_df = self._humanize(station_df)
+        try:
+            station_df = pd.concat(station_data, ignore_index=True)
+        except ValueError:
+            station_df = pd.DataFrame()
 
-            # Empty dataframe should be skipped
-            if station_df.empty:
-                continue
+        station_df = self._organize_df_columns(station_df)
+
+        station_df[Columns.STATION_ID.value] = station_id
+
+        station_df = self._coerce_meta_fields(station_df)
+
+        # Filter for dates range if start_date and end_date are defined
+        if not station_df.empty and self.stations.start_date:
+            station_df = station_df[
+                (station_df[Columns.DATE.value] >= self.stations.start_date)
+                & (station_df[Columns.DATE.value] <= self.stations.end_date)
+            ]
+
+        station_df = self._coerce_parameter_types(station_df)
+
+        # Assign meaningful parameter names (humanized).
+        if self.stations.humanize:
+            return self._humanize(station_df)
 
-            # TODO: add more meaningful metadata here
-            yield ValuesResult(stations=self.stations, df=station_df)
+        return station_df
 
     @abstractmethod
     def _collect_station_parameter(self, station_id: str, parameter: Enum, dataset: Enum) -> pd.DataFrame:
@@ -7,6 +7,7 @@ from itertools import repeat
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
+from cachetools.func import ttl_cache
 from pandas import Timedelta, Timestamp
 
 from wetterdienst.core.scalar.request import ScalarRequestCore
@@ -53,6 +54,7 @@ from wetterdienst.provider.dwd.observation.util.parameter import (
     check_dwd_observations_dataset,
 )
 from wetterdienst.provider.dwd.util import build_parameter_set_identifier
+from wetterdienst.util.cache import WD_CACHE_DISABLE, CacheExpiry
 from wetterdienst.util.enumeration import parse_enumeration_from_template
 
 log = logging.getLogger(__name__)
@@ -78,6 +80,10 @@ class DwdObservationValues(ScalarValuesCore):
     _period_type = PeriodType.MULTI
     _period_base = DwdObservationPeriod
 
+    # Maximum number of files downloaded concurrently per station, as multiple stations
+    # are already collected concurrently
+    _max_download_workers = 4
+
     @property
     def _datetime_format(self):
         """
@@ -169,7 +175,9 @@ class DwdObservationValues(ScalarValuesCore):
                 log.info(f"No files found for {parameter_identifier}. Station will be skipped.")
                 continue
 
-            filenames_and_files = download_climate_observations_data_parallel(remote_files)
+            filenames_and_files = download_climate_observations_data_parallel(
+                remote_files, max_workers=self._max_download_workers
+            )
 
             period_df = parse_climate_observations_data(filenames_and_files, dataset, self.stations.resolution, period)
 
@@ -554,12 +562,33 @@ class DwdObservationRequest(ScalarRequestCore):
 
         return read_description(description_file_url, language=language)
 
+    @staticmethod
+    @ttl_cache(maxsize=64, ttl=CacheExpiry.FILEINDEX.value)
+    def _create_station_index(dataset: DwdObservationDataset, resolution: Resolution, period: Period) -> pd.DataFrame:
+        """
+        Create the list of stations that have data available for a given dataset,
+        resolution and period. The parsed result is kept in memory for the same time
+        as the file index is cached, so repeated requests do not parse the files again
+        while still picking up updated station lists. The returned DataFrame must not
+        be modified.
+
+        :param dataset: dataset for which stations are listed
+        :param resolution: resolution for which stations are listed
+        :param period: period for which stations are listed
+        :return: pandas.DataFrame with stations from the meta index that also have files
+        """
+        df = create_meta_index_for_climate_observations(dataset, resolution, period)
+
+        file_index = create_file_index_for_climate_observations(dataset, resolution, period)
+
+        return df[df.loc[:, Columns.STATION_ID.value].isin(file_index[Columns.STATION_ID.value])]
+
     def _all(self) -> pd.DataFrame:
         """
 
         :return:
         """
-        datasets = pd.Series(self.parameter).map(lambda x: x[1]).unique()
+        datasets = list(dict.fromkeys(dataset for _, dataset in self.parameter))
 
         stations = []
 
@@ -574,11 +603,10 @@ class DwdObservationRequest(ScalarRequestCore):
 
                     continue
 
-                df = create_meta_index_for_climate_observations(dataset, self.resolution, period)
-
-                file_index = create_file_index_for_climate_observations(dataset, self.resolution, period)
-
-                df = df[df.loc[:, Columns.STATION_ID.value].isin(file_index[Columns.STATION_ID.value])]
+                if WD_CACHE_DISABLE:
+                    df = self._create_station_index.__wrapped__(dataset, self.resolution, period)
+                else:
+                    df = self._create_station_index(dataset, self.resolution, period).copy()
 
                 stations.append(df)
 
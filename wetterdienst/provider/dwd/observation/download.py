@@ -3,7 +3,7 @@
 # Distributed under the MIT License. See LICENSE for more info.
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from zipfile import BadZipFile
 
 from fsspec.implementations.zip import ZipFileSystem
@@ -16,14 +16,17 @@ from wetterdienst.util.network import download_file
 
 def download_climate_observations_data_parallel(
     remote_files: List[str],
+    max_workers: Optional[int] = None,
 ) -> List[Tuple[str, BytesIO]]:
     """
     Wrapper for ``_download_dwd_data`` to provide a multiprocessing feature.
 
     :param remote_files:    List of requested files
+    :param max_workers:     Maximum number of concurrent downloads, defaults to the
+                            one of ThreadPoolExecutor
     :return:                List of downloaded files
     """
-    with ThreadPoolExecutor() as p:
+    with ThreadPoolExecutor(max_workers=max_workers) as p:
         files_in_bytes = p.map(_download_climate_observations_data, remote_files)
 
     return list(zip(remote_files, files_in_bytes))
@@ -287,7 +287,8 @@ def _download_metadata_file_for_1minute_precipitation(metadata_file: str) -> Byt
     writes the content to a BytesIO object and returns this object. For this case as it
     opens lots of requests (there are approx 1000 different files to open for
     1minute data), it will do the same at most three times for one file to assure
-    success reading the file.
+    success reading the file. Files are cached like the other metadata files as they
+    rarely change.
 
     Args:
         metadata_file (str) - the file that shall be downloaded and returned as bytes.
@@ -297,7 +298,7 @@ def _download_metadata_file_for_1minute_precipitation(metadata_file: str) -> Byt
 
     """
     try:
-        return download_file(metadata_file, ttl=CacheExpiry.NO_CACHE)
+        return download_file(metadata_file, ttl=CacheExpiry.METAINDEX)
     except InvalidURL as e:
         raise InvalidURL(f"Reading metadata {metadata_file} file failed.") from e
 
@@ -219,12 +219,13 @@ class EcccObservationValues(ScalarValuesCore):
         if resolution == Resolution.HOURLY:
             freq = "M"
 
+        # Station and timeframe are the same for all files
+        station_url = self._base_url.format(int(station_id), self._timeframe)
+
         # For hourly data request only necessary data to reduce amount of data being
         # downloaded and parsed
         for date in pd.date_range(f"{start_year}-01-01", f"{end_year + 1}-01-01", freq=freq, closed=None):
-            url = self._base_url.format(int(station_id), self._timeframe)
-
-            url += f"&Year={date.year}"
+            url = f"{station_url}&Year={date.year}"
 
             if resolution == Resolution.HOURLY:
                 url += f"&Month={date.month}"
@@ -20,6 +20,8 @@ class Settings:
             humanize: bool = env.bool("HUMANIZE", True)
             tidy: bool = env.bool("TIDY", True)
             si_units: bool = env.bool("SI_UNITS", True)
+            # number of stations of which values are collected concurrently
+            max_workers: int = env.int("MAX_WORKERS", 4)
 
     @classmethod
     def reset(cls):
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 # Copyright (c) 2018-2021, earthobservations developers.
 # Distributed under the MIT License. See LICENSE for more info.
+import math
 from typing import Tuple, Union
 
 import numpy as np
-from sklearn.neighbors import BallTree
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371
 
 
 class Coordinates:
@@ -41,6 +44,21 @@ class Coordinates:
         return np.array_equal(self.latitudes, other.latitudes) and np.array_equal(self.longitudes, other.longitudes)
 
 
+def _to_cartesian(latitudes: np.array, longitudes: np.array) -> np.array:
+    """
+    Project coordinates given in radians onto the unit sphere
+
+    Returns: array of shape (n, 3) with x, y and z coordinates
+
+    """
+    cos_latitudes = np.cos(latitudes)
+
+    return np.stack(
+        [cos_latitudes * np.cos(longitudes), cos_latitudes * np.sin(longitudes), np.sin(latitudes)],
+        axis=-1,
+    )
+
+
 def derive_nearest_neighbours(
     latitudes: np.array,
     longitudes: np.array,
@@ -51,6 +69,9 @@ def derive_nearest_neighbours(
     A function that uses a k-d tree algorithm to obtain the nearest
     neighbours to coordinate pairs
 
+    The stations are projected onto the unit sphere so that the euclidean (chord)
+    distances found by the tree can be converted back to great circle distances.
+
     Args:
         latitudes (np.array): latitude values of stations being compared to
         the coordinates
@@ -61,13 +82,128 @@ def derive_nearest_neighbours(
         number_nearby: Number of stations that should be nearby
 
     Returns:
-        Tuple of distances and ranks of nearest to most distant stations
+        Tuple of distances (in radians) and ranks of nearest to most distant stations
+    """
+    distance_tree = derive_distance_tree(np.radians(latitudes), np.radians(longitudes), ball_query=False)
+
+    query = coordinates.get_coordinates_in_radians().reshape(-1, 2)
+    query = _to_cartesian(query[:, 0], query[:, 1])
+
+    distances, indices = distance_tree.query(query, k=number_nearby)
+
+    # Chord length on the unit sphere to central angle
+    distances = 2 * np.arcsin(np.clip(distances / 2, 0, 1))
+
+    return distances.reshape(-1, number_nearby), indices.reshape(-1, number_nearby).astype(int)
+
+
+def derive_distance_tree(latitudes: np.array, longitudes: np.array, ball_query: bool = True):
+    """
+    A function that builds a k-d tree of coordinates projected onto the unit sphere,
+    which can be queried repeatedly with query_nearest_neighbours and
+    query_neighbours_within
+
+    If installed, pykdtree is used for trees that are only queried for nearest
+    neighbours as it builds and queries faster than scipy, but has no ball queries.
+
+    Args:
+        latitudes (np.array): latitudes in radians
+        longitudes (np.array): longitudes in radians
+        ball_query: whether the tree has to support query_neighbours_within
+
+    Returns:
+        k-d tree of the coordinates
+    """
+    points = _to_cartesian(latitudes, longitudes)
+
+    if not ball_query:
+        try:
+            from pykdtree.kdtree import KDTree
+        except ImportError:
+            pass
+        else:
+            return KDTree(points, leafsize=16)
+
+    return cKDTree(points, leafsize=16)
+
+
+def query_nearest_neighbours(tree, latitude: float, longitude: float, number_nearby: int) -> np.ndarray:
+    """
+    A function that queries a tree built with derive_distance_tree for the nearest
+    neighbours of a point
+
+    Args:
+        tree: k-d tree of coordinates
+        latitude: latitude of the point in radians
+        longitude: longitude of the point in radians
+        number_nearby: Number of neighbours that should be found
+
+    Returns:
+        indices of nearest to most distant neighbours
+    """
+    _, indices = tree.query(_to_cartesian(latitude, longitude).reshape(1, 3), k=number_nearby)
+
+    return indices.reshape(-1).astype(int)
+
+
+def query_neighbours_within(tree: cKDTree, latitude: float, longitude: float, distance: float) -> np.ndarray:
+    """
+    A function that queries a tree built with derive_distance_tree for all neighbours
+    of a point within a given distance
+
+    The radius is widened by a tiny margin to not lose neighbours right at the border to
+    rounding, so the distances should be checked again by the caller.
+
+    Args:
+        tree (cKDTree): k-d tree of coordinates, built with ball_query
+        latitude: latitude of the point in radians
+        longitude: longitude of the point in radians
+        distance: distance in km
+
+    Returns:
+        unordered indices of neighbours within the distance
     """
-    points = np.c_[np.radians(latitudes), np.radians(longitudes)]
+    # Great circle distance to chord length on the unit sphere
+    chord = 2 * math.sin(min(distance / EARTH_RADIUS_KM, math.pi) / 2)
+
+    indices = tree.query_ball_point(_to_cartesian(latitude, longitude), r=chord * (1 + 1e-9), workers=-1)
+
+    return np.array(indices, dtype=int)
+
+
+def haversine_vector(
+    latitude: float,
+    longitude: float,
+    latitudes: np.array,
+    longitudes: np.array,
+) -> np.ndarray:
+    """
+    Great circle distances from one point to many points, computed in a single
+    vectorized pass
+
+    The point itself is handled with the math module if given as scalar, as numpy
+    ufuncs come with a considerable overhead for single values.
+
+    Args:
+        latitude: latitude of the point in radians
+        longitude: longitude of the point in radians
+        latitudes (np.array): latitudes of the points in radians
+        longitudes (np.array): longitudes of the points in radians
+
+    Returns:
+        distances in km
+    """
+    if np.isscalar(latitude):
+        cos_latitude = math.cos(latitude)
+    else:
+        cos_latitude = np.cos(latitude)
+
+    dlat = latitudes - latitude
+    dlon = longitudes - longitude
 
-    distance_tree = BallTree(points, metric="haversine")
+    a = np.sin(dlat / 2) ** 2 + cos_latitude * np.cos(latitudes) * np.sin(dlon / 2) ** 2
 
-    return distance_tree.query(coordinates.get_coordinates_in_radians().reshape(-1, 2), k=number_nearby)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
 
 
 def convert_dm_to_dd(dms: float) -> float: